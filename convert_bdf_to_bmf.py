@@ -9,6 +9,7 @@ convert_bdf_to_bmf.py
 
 from pathlib import Path
 import math
+import numpy as np
 from PIL import Image
 from bdflib import reader
 from luma.core.bitmap_font import load_sprite_table
@@ -34,11 +35,13 @@ for g in bdf.glyphs:
 if not glyphs:
     raise RuntimeError("有効なグリフが見つかりませんでした。")
 
-# 3) 全グリフの最大セル幅・高さを求める
+# 3) 全グリフの最大セル幅・高さを求める (高さは data の行数ではなくバウンディングボックスから)
 cell_w = max(g.get_bounding_box()[2] for g in glyphs)
-cell_h = max(len(g.data) for g in glyphs)
+cell_h = max(g.get_bounding_box()[3] for g in glyphs)
 
 # 4) シート配置を計算
+#    bitmap_font.save() は全グリフを最大セルの一様グリッドに並べ直すため、
+#    ここで詰めて配置しても .bmf は小さくならない (グリフごとのメトリクスが増えるだけ)
 count   = len(glyphs)
 cols    = int(math.ceil(math.sqrt(count)))
 rows    = int(math.ceil(count / cols))
@@ -46,18 +49,29 @@ sheet_w = cols * cell_w
 sheet_h = rows * cell_h
 
 # 5) スプライトシートを作成し各グリフを貼り付け
-sheet = Image.new("1", (sheet_w, sheet_h))
+#    行ビットマスク (右詰め w ビット) は同じ大きさのグリフごとにまとめて NumPy でビット展開する
+groups = {}
 for idx, g in enumerate(glyphs):
     xoff, yoff, w, h = g.get_bounding_box()
-    char_img = Image.new("1", (cell_w, cell_h))
-    for y, row_mask in enumerate(g.data):
-        for x in range(w):
-            if (row_mask >> (w - 1 - x)) & 1:
-                # MAX7219での座標基準に合わせてグリフドットを上下反転する
-                char_img.putpixel((x, cell_h - 1 - y), 1)
-    cx = (idx % cols) * cell_w
-    cy = (idx // cols) * cell_h
-    sheet.paste(char_img, (cx, cy))
+    groups.setdefault((w, h), []).append(idx)
+
+sheet_arr = np.zeros((sheet_h, sheet_w), dtype=np.uint8)
+for (w, h), members in groups.items():
+    # 全行を最小バイト数のビッグエンディアンに詰め、1 回でビット展開する
+    # (unpackbits は MSB 先頭なので、ビット反転テーブルを通さずそのまま左→右の並びになる)
+    nbytes = (w + 7) // 8
+    raw = b"".join(
+        row.to_bytes(nbytes, "big") for idx in members for row in glyphs[idx].data[:h]
+    )
+    bits = np.unpackbits(
+        np.frombuffer(raw, dtype=np.uint8).reshape(len(members), h, nbytes), axis=2
+    )[:, :, nbytes * 8 - w:]
+    for k, idx in enumerate(members):
+        cx = (idx % cols) * cell_w
+        cy = (idx // cols) * cell_h
+        # MAX7219での座標基準に合わせてグリフドットを上下反転する (上側 cell_h - h 行は空き)
+        sheet_arr[cy + cell_h - h:cy + cell_h, cx:cx + w] = bits[k, ::-1]
+sheet = Image.fromarray(sheet_arr * 255, "L").convert("1")
 
 # 6) コードポイント順リストを作成
 index = [g.codepoint for g in glyphs]
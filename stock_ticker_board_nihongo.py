@@ -2,7 +2,7 @@
 """
 Raspberry Pi MAX7219 スクロール株価表示
   - luma.led_matrix (MAX7219) で 8x8 マトリクスにテキストをスクロール
-  - yfinance で株価取得、自前の TTL キャッシュ
+  - yfinance で株価取得、自前の TTL キャッシュ（市場の開閉で有効期間を切り替え）
   - Config クラスに設定集約、社名マッピング対応
   - 銘柄名は美咲フォント、株価数字は CP437 フォントで混在表示
   - 株価数字を 1 ドット下にオフセット、末尾の空白で見切れ防止
@@ -11,51 +11,95 @@ Raspberry Pi MAX7219 スクロール株価表示
 
 import time
 import re
+import os
+import json
+import random
 import logging
 import argparse
-from typing import List, Optional, Tuple, Dict
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, time as dtime, timedelta
+from typing import List, Optional, Tuple, Dict, Iterator
+from zoneinfo import ZoneInfo
 
+import requests
+from requests.adapters import HTTPAdapter
 import yfinance as yf
+from PIL import Image, ImageDraw
 from luma.core.interface.serial import spi, noop
 from luma.led_matrix.device import max7219
-from luma.core.render import canvas
-from luma.core.virtual import viewport
 from luma.core.bitmap_font import load
 # レガシーフォント用
-from luma.core.legacy import text as legacy_text
+from luma.core.legacy import text as legacy_text, textsize as legacy_textsize
 from luma.core.legacy.font import proportional, CP437_FONT
+try:
+    # あれば高速な orjson で JSON を読む
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+# Yahoo Finance のクオート API（1 リクエストで複数銘柄をまとめて取得）
+QUOTE_URL = "https://query1.finance.yahoo.com/v7/finance/quote"
+# クオート API は Cookie と crumb が必要（fc.yahoo.com で Cookie を受け取り、crumb を発行してもらう）
+COOKIE_URL = "https://fc.yahoo.com"
+CRUMB_URL = "https://query1.finance.yahoo.com/v1/test/getcrumb"
+QUOTE_USER_AGENT = "Mozilla/5.0 (X11; Linux aarch64) AppleWebKit/537.36 (KHTML, like Gecko)"
+QUOTE_BATCH_SIZE = 20          # 1 リクエストあたりの最大銘柄数
+QUOTE_TIMEOUT = 10             # リクエストのタイムアウト（秒）
+FETCH_WORKERS = 8              # 個別取得を並列実行するスレッド数
+HTTP_POOL_SIZE = 16            # 使い回す HTTPS コネクションの上限
+HTTP_RETRIES = 2               # 接続エラー時の再試行回数
+BACKOFF_MAX_STEPS = 6          # 取得失敗が続いた銘柄の有効期間を倍にしていく上限回数
+BACKOFF_JITTER = 0.25          # 再取得タイミングを銘柄ごとにばらつかせる幅 (±25%)
+
+# 取引所ごとの取引時間（現地時刻、平日のみ。祝日は考慮しない）
+TSE_TZ = ZoneInfo("Asia/Tokyo")
+TSE_SESSIONS = ((dtime(9, 0), dtime(11, 30)), (dtime(12, 30), dtime(15, 30)))
+TSE_QUOTE_DELAY = timedelta(minutes=20)  # 東証の株価は遅延配信なので引け後もしばらく更新する
+NYSE_TZ = ZoneInfo("America/New_York")
+NYSE_SESSIONS = ((dtime(9, 30), dtime(16, 0)),)
+NYSE_QUOTE_DELAY = timedelta(0)          # 米国株はリアルタイム配信
+CLOSE_GRACE = timedelta(minutes=5)       # 引け値が配信に反映されるまでの猶予
+TSE = (TSE_TZ, TSE_SESSIONS, TSE_QUOTE_DELAY)
+NYSE = (NYSE_TZ, NYSE_SESSIONS, NYSE_QUOTE_DELAY)
 
 
 class Config:
     # 表示するティッカーシンボル／コード一覧
-STOCK_CODES: List[str] = [
-    "AAPL",
-    "NVDA",
-    "TSLA",
-    "7203.T",
-    "6758.T",
-    "9984.T",
-    "2914.T",
-    "7011.T",
-    "8058.T",
-    "9104.T"
-]
+    STOCK_CODES: List[str] = [
+        "AAPL",
+        "NVDA",
+        "TSLA",
+        "7203.T",
+        "6758.T",
+        "9984.T",
+        "2914.T",
+        "7011.T",
+        "8058.T",
+        "9104.T"
+    ]
 
     # カスタム社名マッピング: シンボル → 表示社名
-COMPANY_NAMES: Dict[str, str] = {
-    "AAPL":    "Ａｐｐｌｅ",
-    "NVDA":    "ＮＶＩＤＩＡ",
-    "TSLA":    "Ｔｅｓｌａ",
-    "7203.T":  "トヨタ",
-    "6758.T":  "ＳＯＮＹ",
-    "9984.T":  "ソフトバンクＧ",
-    "2914.T":  "ＪＴ",
-    "7011.T":  "三菱重工",
-    "8058.T":  "三菱商事",
-    "9104.T":  "商船三井"
-}
-
-    CACHE_TTL: int = 160           # キャッシュ有効期間（秒）
+    COMPANY_NAMES: Dict[str, str] = {
+        "AAPL":    "Ａｐｐｌｅ",
+        "NVDA":    "ＮＶＩＤＩＡ",
+        "TSLA":    "Ｔｅｓｌａ",
+        "7203.T":  "トヨタ",
+        "6758.T":  "ＳＯＮＹ",
+        "9984.T":  "ソフトバンクＧ",
+        "2914.T":  "ＪＴ",
+        "7011.T":  "三菱重工",
+        "8058.T":  "三菱商事",
+        "9104.T":  "商船三井"
+    }
+
+    CACHE_TTL_US_OPEN: int = 30    # 米国市場の取引時間中のキャッシュ有効期間（秒）
+    CACHE_TTL_JP_OPEN: int = 300   # 東証の取引時間中のキャッシュ有効期間（秒）
+    CACHE_TTL_CLOSED: int = 86400  # 市場が閉まっている間のキャッシュ有効期間（秒）
+    CACHE_TTL_ERROR: int = 160     # 株価を取得できなかった銘柄の再取得間隔（秒）
+    CACHE_PATH: str = "/var/tmp/stockticker_cache.json"  # 再起動をまたいで使うキャッシュファイル
+    CACHE_SAVE_INTERVAL: float = 5 # キャッシュファイルの最短書き込み間隔（秒）
+    REFRESH_INTERVAL: float = 15   # バックグラウンドで株価を更新する間隔（秒）
     SPI_PORT: int = 0
     SPI_DEVICE: int = 0
     CASCADED: int = 8              # LEDドットマトリクス基板1個だけなら 4 にする
@@ -69,34 +113,297 @@ COMPANY_NAMES: Dict[str, str] = {
 
 
 class StockFetcher:
-    def __init__(self, codes: List[str], ttl: int):
+    def __init__(self, codes: List[str], cfg: Config):
+        # クオート API 直接呼び出し用のセッション。TLS 接続をプールして使い回す (keep-alive)
+        adapter = HTTPAdapter(
+            pool_connections=HTTP_POOL_SIZE,
+            pool_maxsize=HTTP_POOL_SIZE,
+            max_retries=HTTP_RETRIES
+        )
+        self.session = requests.Session()
+        self.session.mount("https://", adapter)
+        self.session.headers["User-Agent"] = QUOTE_USER_AGENT
+        self._crumb: Optional[str] = None
+        self._quote_fails = 0
+        self._quote_retry_at = 0.0
+        # yfinance は内部で curl_cffi のセッションを全 Ticker で共有しているので、ここでは渡さない
+        # (requests.Session を渡すと現行の yfinance は YFDataException を送出する)
         self.tickers = {code: yf.Ticker(code) for code in codes}
-        self.ttl = ttl
+        self.ttl_us_open = cfg.CACHE_TTL_US_OPEN
+        self.ttl_jp_open = cfg.CACHE_TTL_JP_OPEN
+        self.ttl_closed = cfg.CACHE_TTL_CLOSED
+        self.ttl_error = cfg.CACHE_TTL_ERROR
         self._cache: Dict[str, Tuple[Optional[float], float]] = {}
+        self._name_cache: Dict[str, str] = {}
+        self._fail_count: Dict[str, int] = {}
+        self._backoff: Dict[str, float] = {}
+        self.cache_path = cfg.CACHE_PATH
+        self.save_interval = cfg.CACHE_SAVE_INTERVAL
+        self._save_lock = threading.Lock()
+        self._last_save = 0.0
+        self._load_cache()
+
+    # 前回保存したキャッシュのうち、まだ有効期間内のものだけを読み込む
+    def _load_cache(self) -> None:
+        try:
+            with open(self.cache_path) as fp:
+                saved = json.load(fp)
+            # 取得失敗 (price が None) の記録や対象外の銘柄は引き継がない
+            for code, (price, ts) in saved.items():
+                if code in self.tickers and price is not None:
+                    self._cache[code] = (float(price), float(ts))
+        except (OSError, ValueError, TypeError, AttributeError) as e:
+            logging.info(f"キャッシュファイルを読み込みません {self.cache_path}: {e}")
+        now = time.time()
+        self._cache = {code: v for code, v in self._cache.items() if self._is_fresh(code, now)}
+
+    # キャッシュをファイルに書き出す（force でなければ save_interval 秒に 1 回まで）
+    def _save_cache(self, force: bool = False) -> None:
+        with self._save_lock:
+            now = time.monotonic()
+            if not force and now - self._last_save < self.save_interval:
+                return
+            self._last_save = now
+            data = {code: list(v) for code, v in dict(self._cache).items()}
+            tmp = self.cache_path + ".tmp"
+            try:
+                with open(tmp, "w") as fp:
+                    json.dump(data, fp)
+                os.replace(tmp, self.cache_path)
+            except OSError as e:
+                logging.warning(f"キャッシュ保存エラー {self.cache_path}: {e}")
+
+    # 銘柄の市場（".T" は東証、それ以外は米国）が開いているかでキャッシュ有効期間を決める
+    def _ttl_for(self, code: str, now: float, ts: float) -> float:
+        if code.endswith(".T"):
+            market, open_ttl = TSE, self.ttl_jp_open
+        else:
+            market, open_ttl = NYSE, self.ttl_us_open
+        if is_market_open(*market, now):
+            return open_ttl
+        # 引け後にまだ取得していない株価は終値ではないので、1 回だけ取り直す
+        closed_at = last_session_end(*market, now)
+        if closed_at is not None and ts < closed_at:
+            return 0
+        return self.ttl_closed
+
+    def _is_fresh(self, code: str, now: float) -> bool:
+        if code not in self._cache:
+            return False
+        price, ts = self._cache[code]
+        ttl = self.ttl_error if price is None else self._ttl_for(code, now, ts)
+        if code in self._fail_count:
+            # 取得に失敗して古い株価を残している銘柄は、休場中でもエラー時の間隔で取り直す
+            ttl = min(ttl, self.ttl_error)
+        # 失敗が続いている銘柄は指数バックオフ（上限は市場休場中の有効期間）
+        ttl = min(ttl * self._backoff.get(code, 1.0), self.ttl_closed)
+        return now - ts < ttl
+
+    # クオート API を直接呼び、{シンボル: (株価, shortName)} を返す
+    #   yfinance の .info は不要なモジュールまで組み立てるため、必要な 2 項目だけ読む
+    #   crumb が失効していたら (401/403) 取り直して 1 回だけやり直す
+    def _quote(self, symbols: List[str]) -> Dict[str, Tuple[Optional[float], Optional[str]]]:
+        for retry in (False, True):
+            if self._crumb is None:
+                self._crumb = self._fetch_crumb()
+            r = self.session.get(
+                QUOTE_URL,
+                params={"symbols": ",".join(symbols), "crumb": self._crumb},
+                timeout=QUOTE_TIMEOUT
+            )
+            if r.status_code in (401, 403) and not retry:
+                self._crumb = None
+                continue
+            break
+        r.raise_for_status()
+        return {
+            quote["symbol"]: (quote.get("regularMarketPrice"), quote.get("shortName"))
+            for quote in json_loads(r.content)["quoteResponse"]["result"]
+        }
+
+    def _fetch_crumb(self) -> str:
+        # fc.yahoo.com 自体はエラーを返すが、Cookie はセッションに保存される
+        self.session.get(COOKIE_URL, timeout=QUOTE_TIMEOUT)
+        r = self.session.get(CRUMB_URL, timeout=QUOTE_TIMEOUT)
+        r.raise_for_status()
+        crumb = r.text.strip()
+        if not crumb or "<" in crumb:
+            raise ValueError(f"crumb を取得できません: {crumb[:40]!r}")
+        return crumb
+
+    # 一括取得に失敗したら、しばらく（失敗が続くほど長く）クオート API を使わない
+    def _quote_usable(self, now: float) -> bool:
+        return now >= self._quote_retry_at
+
+    def _quote_failed(self, now: float) -> None:
+        self._quote_fails = min(self._quote_fails + 1, BACKOFF_MAX_STEPS)
+        self._quote_retry_at = now + self.ttl_error * 2 ** (self._quote_fails - 1)
+
+    def _quote_succeeded(self) -> None:
+        self._quote_fails = 0
+        self._quote_retry_at = 0.0
+
+    # 期限切れの銘柄をクオート API でまとめて取得し、キャッシュを更新する
+    def refresh_all(self) -> None:
+        now = time.time()
+        stale = [code for code in self.tickers if not self._is_fresh(code, now)]
+        batch = stale if self._quote_usable(now) else []
+        for i in range(0, len(batch), QUOTE_BATCH_SIZE):
+            chunk = batch[i:i + QUOTE_BATCH_SIZE]
+            try:
+                quotes = self._quote(chunk)
+            except Exception as e:
+                logging.warning(f"一括株価取得エラー {','.join(chunk)}: {e}")
+                self._quote_failed(now)
+                break
+            self._quote_succeeded()
+            for code, (price, name) in quotes.items():
+                if code not in self.tickers:
+                    continue
+                if name:
+                    self._name_cache.setdefault(code, name)
+                if price is not None:
+                    self._cache[code] = (price, now)
+                    self._fail_count.pop(code, None)
+                    self._backoff.pop(code, None)
+        # 一括取得できなかった銘柄は個別取得（history へのフォールバックを含む）
+        # 通信待ちが大半なのでスレッドで並列に投げる
+        missing = [code for code in stale if not self._is_fresh(code, now)]
+        if missing:
+            with ThreadPoolExecutor(max_workers=min(FETCH_WORKERS, len(missing))) as ex:
+                list(ex.map(self.fetch_price, missing))
+        if stale:
+            self._save_cache(force=True)
 
     def fetch_price(self, code: str) -> Optional[float]:
         now = time.time()
-        if code in self._cache:
-            price, ts = self._cache[code]
-            if now - ts < self.ttl:
-                return price
+        if self._is_fresh(code, now):
+            return self._cache[code][0]
         try:
             info = self.tickers[code].info
             price = info.get("regularMarketPrice")
             if price is None:
                 hist = self.tickers[code].history(period="1d", interval="1m")
                 price = hist["Close"].iloc[-1]
+            self._fail_count.pop(code, None)
+            self._backoff.pop(code, None)
         except Exception as e:
             logging.warning(f"株価取得エラー {code}: {e}")
             price = self._cache.get(code, (None, 0))[0]
+            # 同時に再試行が集中しないよう、銘柄ごとにジッターを付けて間隔を延ばす
+            fails = min(self._fail_count.get(code, 0) + 1, BACKOFF_MAX_STEPS)
+            self._fail_count[code] = fails
+            self._backoff[code] = 2 ** fails * random.uniform(
+                1 - BACKOFF_JITTER, 1 + BACKOFF_JITTER
+            )
         self._cache[code] = (price, now)
+        self._save_cache()
         return price
 
+    # 銘柄名 (shortName) は変わらないので、取得できたものはプロセス中ずっと使い回す
+    def fetch_name(self, code: str) -> str:
+        if code not in self._name_cache:
+            try:
+                self._name_cache[code] = self.tickers[code].info.get("shortName", code)
+            except Exception as e:
+                logging.warning(f"銘柄名取得エラー {code}: {e}")
+                return code
+        return self._name_cache[code]
+
+    def has_name(self, code: str) -> bool:
+        return code in self._name_cache
+
+    # 複数銘柄の銘柄名をクオート API でまとめて取得し、取れなかった分だけ .info で引く
+    def fetch_names(self, codes: List[str]) -> Dict[str, str]:
+        now = time.time()
+        missing = [code for code in codes if code not in self._name_cache]
+        batch = missing if self._quote_usable(now) else []
+        for i in range(0, len(batch), QUOTE_BATCH_SIZE):
+            chunk = batch[i:i + QUOTE_BATCH_SIZE]
+            try:
+                quotes = self._quote(chunk)
+            except Exception as e:
+                logging.warning(f"一括銘柄名取得エラー {','.join(chunk)}: {e}")
+                self._quote_failed(now)
+                break
+            self._quote_succeeded()
+            for code, (_, name) in quotes.items():
+                if code in self.tickers and name:
+                    self._name_cache[code] = name
+        return {code: self.fetch_name(code) for code in codes}
+
+
+def is_market_open(
+    tz: ZoneInfo,
+    sessions: Tuple[Tuple[dtime, dtime], ...],
+    delay: timedelta,
+    now: float
+) -> bool:
+    # 寄り付きはそのまま、引けは配信遅延と猶予の分だけ延ばして取引時間内かどうかを判定する
+    local = datetime.fromtimestamp(now, tz)
+    if local.weekday() >= 5:
+        return False
+    day = local.date()
+    return any(
+        datetime.combine(day, start, tz) <= local
+        < datetime.combine(day, end, tz) + delay + CLOSE_GRACE
+        for start, end in sessions
+    )
+
+
+def last_session_end(
+    tz: ZoneInfo,
+    sessions: Tuple[Tuple[dtime, dtime], ...],
+    delay: timedelta,
+    now: float
+) -> Optional[float]:
+    # 直近に終わった取引セッションの終了時刻（配信遅延と猶予を含む）を返す
+    local = datetime.fromtimestamp(now, tz)
+    for days_back in range(8):
+        day = (local - timedelta(days=days_back)).date()
+        if day.weekday() >= 5:
+            continue
+        for _, end in reversed(sessions):
+            closed_at = datetime.combine(day, end, tz) + delay + CLOSE_GRACE
+            if closed_at <= local:
+                return closed_at.timestamp()
+    return None
+
+
+# 前フレームから変化した桁レジスタ (DIGIT_0〜7) だけを SPI で送る max7219
+#   1 回の書き込みでカスケード全体ぶんのバイトが送られるため、差分は桁単位で取る
+#   ビットの組み立ては luma.led_matrix の max7219.display と同じ
+class DeltaMax7219(max7219):
+    def __init__(self, *args, **kwargs):
+        # 親の __init__ で clear() → display() が呼ばれるので先に用意しておく
+        self._last_digits: List[Optional[List[int]]] = [None] * 8
+        super().__init__(*args, **kwargs)
+
+    def display(self, image):
+        assert image.mode == self.mode
+        assert image.size == self.size
+
+        image = self.preprocess(image)
+        pix = list(image.getdata())
+        for digit in range(8):
+            buf = []
+            for daisychained_device in self._offsets:
+                byte = 0
+                idx = daisychained_device + digit
+                for y in self._rows:
+                    if pix[idx] > 0:
+                        byte |= 1 << y
+                    idx += self._w
+                buf += [digit + self._const.DIGIT_0, byte]
+            if buf != self._last_digits[digit]:
+                self.data(buf)
+                self._last_digits[digit] = buf
+
 
 class LEDDisplay:
     def __init__(self, cfg: Config):
         serial = spi(port=cfg.SPI_PORT, device=cfg.SPI_DEVICE, gpio=noop())
-        self.device = max7219(
+        self.device = DeltaMax7219(
             serial,
             cascaded=cfg.CASCADED,
             block_orientation=cfg.BLOCK_ORIENTATION,
@@ -108,49 +415,90 @@ class LEDDisplay:
         self.legacy_font = cfg.LEGACY_FONT
         self.speed = cfg.SCROLL_SPEED
 
-    def scroll_entries(self, entries: List[Tuple[str, str]]):
+    # スクロール全体を 1 枚の画像に描画する（フォント描画はここで一度だけ）
+    def render_strip(self, entries: List[Tuple[str, str]]) -> Image.Image:
         char_w = 6
-        blank_name_price = 2
-        blank_entry = 3
-        suffix_blanks = (self.device.width // char_w) + 1
-        total_chars = sum(
-            len(name) + blank_name_price + len(price) + blank_entry
-            for name, price in entries
-        ) + suffix_blanks
-        msg_w = total_chars * char_w
-
-        virt = viewport(
-            self.device,
-            width=msg_w + self.device.width,
-            height=self.device.height
-        )
-        with canvas(virt) as draw:
-            x = self.device.width
-            for name, price in entries:
-                draw.text((x, 0), name, fill="white", font=self.font)
-                x += len(name) * char_w
-                x += blank_name_price * char_w
-                legacy_text(draw, (x, 1), price, fill="white", font=self.legacy_font)
-                x += len(price) * char_w
-                x += blank_entry * char_w
+        blank_name_price = 2 * char_w  # 銘柄名と株価の間の空白（ピクセル）
+        blank_entry = 3 * char_w       # 銘柄ごとの間の空白（ピクセル）
+        width, height = self.device.width, self.device.height
+        # 文字列の幅はフォントの実寸で測る（同じ文字列は 1 回だけ）
+        name_w = {name: self.font.getsize(name)[0] for name in {name for name, _ in entries}}
+        price_w = {
+            price: legacy_textsize(price, font=self.legacy_font)[0]
+            for price in {price for _, price in entries}
+        }
+        # 描画前に各銘柄名・株価の x 座標を一度に求めておく
+        layout: List[Tuple[int, str, int, str]] = []
+        x = width
+        for name, price in entries:
+            price_x = x + name_w[name] + blank_name_price
+            layout.append((x, name, price_x, price))
+            x = price_x + price_w[price] + blank_entry
+        # 末尾は表示幅ぶんの空白だけにして、最後の銘柄が画面から流れ切るまでスクロールする
+        # (最後の株価の後ろの銘柄間スペースは含めない)
+        msg_w = x - blank_entry if entries else x
+
+        strip = Image.new(self.device.mode, (msg_w + width, height))
+        draw = ImageDraw.Draw(strip)
+        for name_x, name, price_x, price in layout:
+            draw.text((name_x, 0), name, fill="white", font=self.font)
+            legacy_text(draw, (price_x, 1), price, fill="white", font=self.legacy_font)
+        return strip
 
-        for pos in range(msg_w + 1):
-            virt.set_position((pos, 0))
-            time.sleep(self.speed)
+    # 描画済みの画像から表示幅ぶんを切り出して 1 フレームずつ表示し、表示した位置を返す
+    #   ジェネレータなので、呼び出し側はフレームの合間に中断して新しい画像に切り替えられる
+    def frames(self, strip: Image.Image, start: int = 0) -> Iterator[int]:
+        width, height = self.device.width, self.device.height
+        msg_w = strip.width - width
+        # SPI 転送などの処理時間もフレーム間隔に含めて一定速度でスクロールする
+        deadline = time.monotonic()
+        for pos in range(start, msg_w + 1):
+            deadline += self.speed
+            self.device.display(strip.crop((pos, 0, pos + width, height)))
+            delay = deadline - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            yield pos
+
+
+_CLEAN_RE = re.compile(
+    r'\b(?:Corporation|Co|Holdings|Inc|LTD|CORP|MOTOR|GROUP)\b\.?',
+    re.IGNORECASE
+)
 
 
 def clean_name(name: str) -> str:
-    pattern = r'\b(?:Corporation|Co|Holdings|Inc|LTD|CORP|MOTOR|GROUP)\b\.?'
-    return re.sub(pattern, '', name, flags=re.IGNORECASE).strip()
+    return _CLEAN_RE.sub('', name).strip()
+
 
+# 表示名は実行中に変わらないので、起動時に一度だけ決めておく
+def resolve_names(codes: List[str], fetcher: StockFetcher) -> Dict[str, str]:
+    # マッピングにない銘柄だけ shortName を取得する
+    unmapped = [code for code in codes if code not in Config.COMPANY_NAMES]
+    short_names = fetcher.fetch_names(unmapped)
+    return {
+        code: Config.COMPANY_NAMES[code] if code in Config.COMPANY_NAMES
+        else clean_name(short_names[code])
+        for code in codes
+    }
 
-def build_entries(codes: List[str], fetcher: StockFetcher) -> List[Tuple[str, str]]:
+
+def build_entries(
+    codes: List[str],
+    fetcher: StockFetcher,
+    names: Dict[str, str]
+) -> List[Tuple[str, str]]:
     entries: List[Tuple[str, str]] = []
+    fetcher.refresh_all()
+    # 起動時に銘柄名を取れなかった銘柄だけ、取得し直す
+    pending = [
+        code for code in codes
+        if code not in Config.COMPANY_NAMES and not fetcher.has_name(code)
+    ]
+    if pending:
+        names.update(resolve_names(pending, fetcher))
     for code in codes:
-        name = Config.COMPANY_NAMES.get(
-            code,
-            clean_name(fetcher.tickers[code].info.get("shortName", code))
-        )
+        name = names[code]
         price = fetcher.fetch_price(code)
         if price is None:
             price_str = "Err"
@@ -166,6 +514,30 @@ def build_entries(codes: List[str], fetcher: StockFetcher) -> List[Tuple[str, st
     return entries
 
 
+# 株価の取得はスクロールと並行してバックグラウンドで行い、最新の表示内容を shared に置く
+def refresh_loop(
+    codes: List[str],
+    fetcher: StockFetcher,
+    names: Dict[str, str],
+    shared: Dict[str, List[Tuple[str, str]]],
+    lock: threading.Lock,
+    dirty: threading.Event,
+    interval: float
+):
+    while True:
+        time.sleep(interval)
+        try:
+            entries = build_entries(codes, fetcher, names)
+        except Exception as e:
+            logging.warning(f"株価更新エラー: {e}")
+            continue
+        with lock:
+            # 内容が変わった時だけ表示側に知らせる
+            if entries != shared["entries"]:
+                shared["entries"] = entries
+                dirty.set()
+
+
 def parse_args():
     p = argparse.ArgumentParser(description="MAX7219 Stock Ticker")
     p.add_argument("--stocks", nargs="+",
@@ -182,16 +554,41 @@ def main():
     )
     args = parse_args()
     codes = args.stocks or Config.STOCK_CODES
-    fetcher = StockFetcher(codes, Config.CACHE_TTL)
+    fetcher = StockFetcher(codes, Config)
+    names = resolve_names(codes, fetcher)
     display = LEDDisplay(Config)
     if args.speed:
         display.speed = args.speed
 
+    # 初回だけは取得を待ってから表示を始める
+    lock = threading.Lock()
+    dirty = threading.Event()
+    shared = {"entries": build_entries(codes, fetcher, names)}
+    threading.Thread(
+        target=refresh_loop,
+        args=(codes, fetcher, names, shared, lock, dirty, Config.REFRESH_INTERVAL),
+        daemon=True
+    ).start()
+
+    last_key = None
+    strip = None
+    pos = 0
     try:
         while True:
-            entries = build_entries(codes, fetcher)
-            display.scroll_entries(entries)
-            time.sleep(1)
+            with lock:
+                entries = shared["entries"]
+                dirty.clear()
+            # 表示内容が前回と同じなら描画済みの画像をそのまま使う
+            key = tuple(entries)
+            if key != last_key or strip is None:
+                strip = display.render_strip(entries)
+                last_key = key
+            # 新しい株価が届いたらそのフレームで打ち切り、同じ位置から新しい画像で続ける
+            start, pos = pos, 0
+            for shown in display.frames(strip, start):
+                if dirty.is_set():
+                    pos = shown + 1
+                    break
     except KeyboardInterrupt:
         logging.info("ユーザーによる中断で終了")
 
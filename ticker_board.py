@@ -25,6 +25,7 @@ CASCADED = 4
 BLOCK_ORIENTATION = -90
 ROTATE = 2
 REVERSE_ORDER = False
+SCROLL_SPEED = 0.05  # seconds per frame; adjust speed as needed
 
 # Initialize MAX7219 device
 serial = spi(port=0, device=0, gpio=noop())
@@ -38,14 +39,18 @@ device = max7219(
 device.contrast(3)
 
 
+# Corporate identifiers stripped from company names (compiled once)
+_CLEAN_RE = re.compile(r'\b(?:Corporation|Inc|LTD|CORP|MOTOR|GROUP)\b\.?', re.IGNORECASE)
+_SPACES_RE = re.compile(r'\s{2,}')
+
+
 def clean_company_name(name):
     """
     Remove specified corporate identifiers from the company name,
     case-insensitive, including optional trailing period.
     """
-    pattern = r'\b(?:Corporation|Inc|LTD|CORP|MOTOR|GROUP)\b\.?'
-    cleaned = re.sub(pattern, '', name, flags=re.IGNORECASE)
-    return re.sub(r'\s{2,}', ' ', cleaned).strip()
+    cleaned = _CLEAN_RE.sub('', name)
+    return _SPACES_RE.sub(' ', cleaned).strip()
 
 
 def fetch_stock_price(code):
@@ -90,7 +95,7 @@ def main():
         # Build full scrolling text with padding at start and end
         prefix = "         "  # spaces before first entry
         suffix = "         "  # spaces after last entry
-        message = prefix + "   ".join(data_list) + suffix
+        message = "".join([prefix, "   ".join(data_list), suffix])  # spaces between entries
         text_width = len(message) * 6  # approximate pixel width
 
         # Create virtual viewport and draw text once
@@ -99,10 +104,16 @@ def main():
             text(draw, (0, 0), message, fill="white", font=proportional(CP437_FONT))
 
         # Scroll text by advancing viewport without overflow
+        # Sleep until a fixed per-frame deadline so SPI transfer time
+        # is absorbed into the frame budget instead of adding to it
         max_pos = text_width - device.width
+        deadline = time.monotonic()
         for x in range(max_pos + 1):
+            deadline += SCROLL_SPEED
             virt.set_position((x, 0))
-            time.sleep(0.05)  # adjust speed as needed
+            delay = deadline - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
 
 if __name__ == "__main__":
     main()